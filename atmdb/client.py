@@ -1,14 +1,20 @@
 """API client wrapper."""
 import asyncio
-from collections import OrderedDict
-from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from datetime import datetime
+from functools import lru_cache, partial
 from http import HTTPStatus
-import json
 import logging
 import random
+import time
 
 import aiohttp
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
 from .core import UrlParamMixin, Service
 from .models import Movie, Person
 
@@ -18,49 +24,275 @@ logger = logging.getLogger(__name__)
 class TMDbClient(UrlParamMixin, Service):
     """Simple wrapper for the `TMDb`_ API.
 
+    Arguments:
+      cache (optional): A cache for successful responses, keyed by URL.
+        Any object exposing ``get(key)`` and ``set(key, value,
+        expire=None)`` (e.g. a :py:class:`diskcache.Cache`) can be used.
+      max_concurrency (:py:class:`int`, optional): The maximum number
+        of simultaneous requests (defaults to :py:attr:`MAX_CONCURRENCY`).
+      rate_limit (:py:class:`tuple`, optional): The maximum number of
+        requests to start in any period, and that period in seconds,
+        e.g. ``(40, 10)`` (defaults to :py:attr:`RATE_LIMIT`).
+
     .. _TMDb: https://www.themoviedb.org/
 
     """
 
     AUTH_PARAM = 'api_key'
 
+    CACHE_EXPIRY = 86400
+    """:py:class:`int`: How long to cache responses for, in seconds, if
+    the API response doesn't specify (via ``Cache-Control`` or
+    ``Expires``)."""
+
+    CONFIG_LIFETIME = 2 * 24 * 60 * 60
+    """:py:class:`int`: How long to use the API configuration for, in
+    seconds, before updating it."""
+
+    CONFIG_STALE_LIFETIME = 24 * 60 * 60
+    """:py:class:`int`: How long to keep using the API configuration
+    after it expires, in seconds, while it is updated in the
+    background."""
+
+    MAX_ATTEMPTS = 5
+    """:py:class:`int`: How many times to try a request that is rate
+    limited or fails with a server error."""
+
+    MAX_BACKOFF = 30
+    """:py:class:`int`: The longest to wait before retrying a request
+    that failed with a server error, in seconds."""
+
+    MAX_CONCURRENCY = 20
+    """:py:class:`int`: The default maximum number of simultaneous
+    requests."""
+
+    POPULAR_LIFETIME = 6 * 60 * 60
+    """:py:class:`int`: How long to reuse pages of popular people for,
+    in seconds."""
+
+    POPULAR_PAGE_SIZE = 20
+    """:py:class:`int`: The expected number of people per page of
+    popular people."""
+
+    RATE_LIMIT = None
+    """:py:class:`tuple`: The default ``(requests, seconds)`` limit on
+    the request rate, or ``None`` to rely on the rate limit headers in
+    API responses."""
+
+    REQUEST_TIMEOUT = 10
+    """:py:class:`int`: How long to wait for each request, in seconds."""
+
     ROOT = 'https://api.themoviedb.org/3/'
 
+    SEARCH_URLS = 1024
+    """:py:class:`int`: How many search URLs to keep in memory, by
+    endpoint and query, rather than encoding them again."""
+
     TOKEN_ENV_VAR = 'TMDB_API_TOKEN'
 
-    def __init__(self, *, api_token=None, **kwargs):
+    VALIDATED_RESPONSES = 1024
+    """:py:class:`int`: How many responses to keep in memory, by URL,
+    to revalidate using their ``ETag`` rather than downloading them
+    again."""
+
+    def __init__(self, *, api_token=None, cache=None, max_concurrency=None,
+                 rate_limit=None, **kwargs):
         super().__init__(api_token=api_token, **kwargs)
+        self.cache = cache
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.rate_limit = rate_limit or self.RATE_LIMIT
+        if self.rate_limit is not None:
+            requests, period = self.rate_limit
+            if requests < 1 or period <= 0:
+                raise ValueError(
+                    'invalid rate limit {!r}'.format(self.rate_limit),
+                )
+        self._headers = dict(Accept='application/json', **super().headers)
         self.config = dict(data=None, last_update=None)
+        self._config_expiry = None
+        self._config_refresh = None
+        self._urls = dict(
+            config=self.url_builder('configuration'),
+            movie=self.url_builder(
+                'movie/{id_}',
+                url_params={'append_to_response': 'credits'},
+            ),
+            person=self.url_builder('person/{id_}'),
+            person_credits=self.url_builder(
+                'person/{id_}',
+                url_params={'append_to_response': 'movie_credits'},
+            ),
+        )
+        self._pending = {}
+        self._popular_pages = {}
+        self._search_url = lru_cache(maxsize=self.SEARCH_URLS)(
+            self._build_search_url,
+        )
+        self._rate_limit_reset = None
+        self._request_lock = None
+        self._request_times = None
+        self._semaphore = None
+        self._session = None
+        self._validated = OrderedDict()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
 
     @property
     def headers(self):
-        return dict(Accept='application/json', **super().headers)
+        return self._headers
+
+    @property
+    def image_config(self):
+        """The API image configuration, if available."""
+        if self.config['data'] is not None:
+            return self.config['data'].get('images')
 
     @property
     def config_expired(self):
         """Whether the configuration data has expired."""
-        return (self.config['last_update'] + timedelta(days=2)) < datetime.now()
+        return (self._config_expiry is None or
+                time.monotonic() >= self._config_expiry)
+
+    @property
+    def _config_stale(self):
+        """Whether expired configuration data can still be used."""
+        if self.config['data'] is None or self._config_expiry is None:
+            return False
+        stale_expiry = self._config_expiry + self.CONFIG_STALE_LIFETIME
+        return time.monotonic() < stale_expiry
+
+    @property
+    def _config_required(self):
+        """Whether the configuration data needs to be updated."""
+        return self.config['data'] is None or self.config_expired
+
+    async def close(self):
+        """Close the underlying HTTP session, if one has been opened.
+
+        Notes:
+          Any requests still in flight are cancelled.
+
+        """
+        if self._config_refresh is not None:
+            self._config_refresh.cancel()
+        for pending in self._pending.values():
+            pending.cancel()
+        self._pending.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._request_lock = None
+        self._request_times = None
+        self._semaphore = None
+
+    def _build_search_url(self, endpoint, query):
+        """Create the URL to search the endpoint for the query.
+
+        Notes:
+          This is memoised per client as :py:meth:`_search_url`, so
+          repeated searches don't encode the same query string again.
+
+        Arguments:
+          endpoint (:py:class:`str`): The search endpoint to access.
+          query (:py:class:`str`): Query to search for.
+
+        Returns:
+          :py:class:`str`: The resulting URL.
+
+        """
+        return self.url_builder(
+            endpoint,
+            url_params={'query': query, 'include_adult': False},
+        )
+
+    def _get_session(self):
+        """Get the HTTP session, creating it if required.
+
+        Notes:
+          The session is shared between requests so that the
+          connection pool can keep connections to the API alive.
+
+        Returns:
+          :py:class:`aiohttp.ClientSession`: The session.
+
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    keepalive_timeout=75,
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+        return self._session
 
     async def _update_config(self):
         """Update configuration data if required.
 
         Notes:
           Per `the documentation`_, this updates the API configuration
-          data *"every few days"*.
+          data *"every few days"*. Configuration that has expired within
+          the last :py:attr:`CONFIG_STALE_LIFETIME` seconds is still
+          used while it is refreshed in the background.
 
         .. _the documentation:
           http://docs.themoviedb.apiary.io/#reference/configuration
 
         """
-        if self.config['data'] is None or self.config_expired:
-            data = await self.get_data(self.url_builder('configuration'))
+        if not self._config_required:
+            return
+        if self._config_stale:
+            if self._config_refresh is None:
+                logger.debug('refreshing stale configuration in background')
+                self._config_refresh = asyncio.ensure_future(
+                    self._refresh_config(),
+                )
+                self._config_refresh.add_done_callback(self._config_refreshed)
+        elif self._config_refresh is not None:
+            await asyncio.shield(self._config_refresh)
+        else:
+            await self._refresh_config()
+
+    async def _refresh_config(self):
+        """Fetch the configuration data and store it.
+
+        Notes:
+          If the request fails, any existing (stale) configuration data
+          is kept rather than being discarded.
+
+        """
+        data = await self.get_data(self._urls['config'])
+        if data is not None or self.config['data'] is None:
             self.config = dict(data=data, last_update=datetime.now())
+            self._config_expiry = time.monotonic() + self.CONFIG_LIFETIME
+
+    def _config_refreshed(self, task):
+        """Clear up after a background configuration refresh."""
+        self._config_refresh = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                'failed to refresh configuration: %r',
+                task.exception(),
+            )
 
     async def get_data(self, url):
-        """Get data from the TMDb API via :py:func:`aiohttp.get`.
+        """Get data from the TMDb API via the shared session.
 
         Notes:
           Updates configuration (if required) on successful requests.
+          If the client has a cache, successful responses are stored
+          in it and served from it until they expire. Recent responses
+          with an ``ETag`` are revalidated with a conditional request.
+          Concurrent requests for the same URL share a single API call,
+          which runs in its own task so that cancelling one caller
+          doesn't cancel it for the others.
 
         Arguments:
           url (:py:class:`str`): The endpoint URL and params.
@@ -68,30 +300,284 @@ class TMDbClient(UrlParamMixin, Service):
         Returns:
           :py:class:`dict`: The parsed JSON result.
 
+        """
+        use_cache = self.cache is not None and url != self._urls['config']
+        if use_cache:
+            body = self.cache.get(url)
+            if body is not None:
+                logger.debug('using cached response for %r', url)
+                if self._config_required:
+                    await self._update_config()
+                return body
+        pending = self._pending.get(url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_data(url, use_cache))
+            pending.add_done_callback(partial(self._fetch_done, url))
+            self._pending[url] = pending
+        else:
+            logger.debug('waiting for in-flight request to %r', url)
+        return await asyncio.shield(pending)
+
+    def _fetch_done(self, url, task):
+        """Clear up after an in-flight request completes.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          task (:py:class:`asyncio.Task`): The request task.
+
+        """
+        if self._pending.get(url) is task:
+            del self._pending[url]
+        if not task.cancelled():
+            # retrieve the exception so failures nobody awaited aren't logged
+            task.exception()
+
+    async def _fetch_data(self, url, use_cache):
+        """Make a request to the TMDb API.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          use_cache (:py:class:`bool`): Whether to cache the response.
+
+        Returns:
+          :py:class:`dict`: The parsed JSON result.
+
         """
         logger.debug('making request to %r', url)
-        with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers) as response:
-                body = json.loads((await response.read()).decode('utf-8'))
-                if response.status == HTTPStatus.OK:
-                    if url != self.url_builder('configuration'):
-                        await self._update_config()
-                    return body
-                elif response.status == HTTPStatus.TOO_MANY_REQUESTS:
-                    timeout = self.calculate_timeout(
-                        response.headers['Retry-After'],
-                    )
-                    logger.warning(
-                        'Request limit exceeded, waiting %s seconds',
+        validated = self._validated.get(url)
+        request_headers = None
+        if validated is not None:
+            request_headers = {'If-None-Match': validated[0]}
+        status, headers, body = await self._request(url, request_headers)
+        status, body = self._revalidate(url, validated, status, headers, body)
+        if status == HTTPStatus.OK:
+            if use_cache:
+                self._cache_response(url, headers, body)
+            if url != self._urls['config'] and self._config_required:
+                await self._update_config()
+            return body
+        message = body.get('status_message') if isinstance(body, dict) else None
+        logger.warning(
+            'request failed %s: %r',
+            status,
+            message or '<no message>',
+        )
+
+    async def _request(self, url, request_headers):
+        """Make a request, retrying if rate limited or on server errors.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          request_headers (:py:class:`dict`): Any additional headers
+            for the request, or ``None``.
+
+        Returns:
+          :py:class:`tuple`: The status, headers and parsed JSON body
+            of the final response.
+
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        session = self._get_session()
+        for attempt in range(self.MAX_ATTEMPTS):
+            await self._wait_for_rate_limit()
+            async with self._semaphore:
+                async with session.get(url, headers=request_headers) as response:
+                    status, headers = response.status, response.headers
+                    body = await self._read_body(response)
+            self._track_rate_limit(headers)
+            if attempt == self.MAX_ATTEMPTS - 1:
+                break
+            timeout = self._retry_timeout(status, headers, attempt)
+            if timeout is None:
+                break
+            await asyncio.sleep(timeout)
+        return status, headers, body
+
+    def _retry_timeout(self, status, headers, attempt):
+        """Calculate how long to wait before retrying a request.
+
+        Arguments:
+          status (:py:class:`int`): The response status.
+          headers (:py:class:`collections.abc.Mapping`): The response
+            headers.
+          attempt (:py:class:`int`): The (zero-based) attempt number.
+
+        Returns:
+          :py:class:`float`: The timeout, in seconds, or ``None`` if
+            the request shouldn't be retried.
+
+        """
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            timeout = None
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                timeout = self.calculate_timeout(retry_after)
+            if timeout is None:
+                timeout = min(2 ** attempt, self.MAX_BACKOFF)
+            logger.warning(
+                'Request limit exceeded, waiting %s seconds',
+                timeout,
+            )
+            return timeout + random.uniform(0, 0.5)
+        if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            timeout = min(2 ** attempt, self.MAX_BACKOFF)
+            logger.warning(
+                'Server error %s, retrying in %s seconds',
+                status,
+                timeout,
+            )
+            return timeout + random.uniform(0, 1)
+        return None
+
+    def _cache_response(self, url, headers, body):
+        """Store a successful response in the cache.
+
+        Notes:
+          The response is cached for as long as its headers allow, or
+          :py:attr:`CACHE_EXPIRY` seconds if they don't say.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          headers (:py:class:`collections.abc.Mapping`): The response
+            headers.
+          body (:py:class:`dict`): The parsed JSON result.
+
+        """
+        lifetime = self.calculate_cache_lifetime(headers)
+        if lifetime is None:
+            lifetime = self.CACHE_EXPIRY
+        if lifetime > 0:
+            self.cache.set(url, body, expire=lifetime)
+
+    @staticmethod
+    async def _read_body(response):
+        """Parse the JSON body of a response.
+
+        Notes:
+          Error responses (e.g. from a gateway in front of the API) may
+          not have a JSON body, so for those a body that can't be
+          parsed is ignored rather than raising.
+
+        Arguments:
+          response (:py:class:`aiohttp.ClientResponse`): The response.
+
+        Returns:
+          The parsed JSON body, or ``None`` if there isn't one.
+
+        """
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return None
+        if response.status < HTTPStatus.BAD_REQUEST:
+            return await response.json(loads=json_loads, content_type=None)
+        try:
+            return await response.json(loads=json_loads, content_type=None)
+        except ValueError:
+            return None
+
+    def _revalidate(self, url, validated, status, headers, body):
+        """Reuse or store a response for conditional requests.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          validated (:py:class:`tuple`): The stored ``ETag`` and body
+            the request was made with, or ``None``.
+          status (:py:class:`int`): The response status.
+          headers (:py:class:`collections.abc.Mapping`): The response
+            headers.
+          body (:py:class:`dict`): The parsed JSON result.
+
+        Returns:
+          :py:class:`tuple`: The effective status and body (the stored
+            body, with an OK status, if it wasn't modified).
+
+        """
+        if status == HTTPStatus.NOT_MODIFIED and validated is not None:
+            logger.debug('response for %r not modified', url)
+            self._validated.move_to_end(url)
+            return HTTPStatus.OK, validated[1]
+        if status == HTTPStatus.OK:
+            self._store_validated(url, headers.get('ETag'), body)
+        return status, body
+
+    def _store_validated(self, url, etag, body):
+        """Store a response to revalidate with a conditional request.
+
+        Notes:
+          Only the :py:attr:`VALIDATED_RESPONSES` most recently used
+          responses are kept.
+
+        Arguments:
+          url (:py:class:`str`): The endpoint URL and params.
+          etag (:py:class:`str`): The response's ``ETag`` header, or
+            ``None`` if it wasn't provided.
+          body (:py:class:`dict`): The parsed JSON result.
+
+        """
+        if etag is None:
+            self._validated.pop(url, None)
+            return
+        self._validated[url] = (etag, body)
+        self._validated.move_to_end(url)
+        if len(self._validated) > self.VALIDATED_RESPONSES:
+            self._validated.popitem(last=False)
+
+    def _track_rate_limit(self, headers):
+        """Record when the rate limit resets, if it has been used up.
+
+        Arguments:
+          headers (:py:class:`collections.abc.Mapping`): The response
+            headers.
+
+        """
+        reset = headers.get('X-RateLimit-Reset')
+        if reset is not None and headers.get('X-RateLimit-Remaining') == '0':
+            try:
+                self._rate_limit_reset = int(reset)
+            except ValueError:
+                pass
+
+    async def _wait_for_rate_limit(self):
+        """Wait until the rate limit resets, if it has been used up.
+
+        Notes:
+          If the client has a :py:attr:`rate_limit`, this also waits
+          until making another request would stay within it.
+
+        """
+        if self._rate_limit_reset is not None:
+            timeout = self._rate_limit_reset - time.time()
+            if timeout > 0:
+                logger.info(
+                    'Request limit reached, waiting %.1f seconds',
+                    timeout,
+                )
+                await asyncio.sleep(timeout)
+            self._rate_limit_reset = None
+        if self.rate_limit is not None:
+            await self._wait_for_request_slot()
+
+    async def _wait_for_request_slot(self):
+        """Wait until a request can be made within :py:attr:`rate_limit`."""
+        if self._request_lock is None:
+            self._request_lock = asyncio.Lock()
+        requests, period = self.rate_limit
+        async with self._request_lock:
+            if (self._request_times is None or
+                    self._request_times.maxlen != requests):
+                self._request_times = deque(
+                    self._request_times or (),
+                    maxlen=requests,
+                )
+            if len(self._request_times) == requests:
+                timeout = self._request_times[0] + period - time.monotonic()
+                if timeout > 0:
+                    logger.debug(
+                        'Request rate limited, waiting %.1f seconds',
                         timeout,
                     )
                     await asyncio.sleep(timeout)
-                    return await self.get_data(url)
-                logger.warning(
-                    'request failed %s: %r',
-                    response.status,
-                    body.get('status_message', '<no message>')
-                )
+            self._request_times.append(time.monotonic())
 
     async def find_movie(self, query):
         """Retrieve movie data by search query.
@@ -103,18 +589,32 @@ class TMDbClient(UrlParamMixin, Service):
           :py:class:`list`: Possible matches.
 
         """
-        params = OrderedDict([
-            ('query', query), ('include_adult', False),
-        ])
-        url = self.url_builder('search/movie', {}, params)
+        url = self._search_url('search/movie', query)
         data = await self.get_data(url)
         if data is None:
             return
+        image_config = self.image_config
         return [
-            Movie.from_json(item, self.config['data'].get('images'))
-            for item in data.get('results', [])
+            Movie.from_json(item, image_config, eager=False)
+            for item in data.get('results', ())
         ]
 
+    async def find_movies(self, queries):
+        """Retrieve movie data for multiple search queries concurrently.
+
+        Arguments:
+          queries (:py:class:`collections.abc.Iterable`): Queries to
+            search for.
+
+        Returns:
+          :py:class:`list`: The possible matches for each query, in
+            the same order as the queries.
+
+        """
+        return await asyncio.gather(
+            *(self.find_movie(query) for query in queries)
+        )
+
     async def find_person(self, query):
         """Retrieve person data by search query.
 
@@ -125,21 +625,32 @@ class TMDbClient(UrlParamMixin, Service):
           :py:class:`list`: Possible matches.
 
         """
-        url = self.url_builder(
-            'search/person',
-            dict(),
-            url_params=OrderedDict([
-                ('query', query), ('include_adult', False)
-            ]),
-        )
+        url = self._search_url('search/person', query)
         data = await self.get_data(url)
         if data is None:
             return
+        image_config = self.image_config
         return [
-            Person.from_json(item, self.config['data'].get('images'))
-            for item in data.get('results', [])
+            Person.from_json(item, image_config, eager=False)
+            for item in data.get('results', ())
         ]
 
+    async def find_people(self, queries):
+        """Retrieve person data for multiple search queries concurrently.
+
+        Arguments:
+          queries (:py:class:`collections.abc.Iterable`): Queries to
+            search for.
+
+        Returns:
+          :py:class:`list`: The possible matches for each query, in
+            the same order as the queries.
+
+        """
+        return await asyncio.gather(
+            *(self.find_person(query) for query in queries)
+        )
+
     async def get_movie(self, id_):
         """Retrieve movie data by ID.
 
@@ -150,15 +661,24 @@ class TMDbClient(UrlParamMixin, Service):
           :py:class:`~.Movie`: The requested movie.
 
         """
-        url = self.url_builder(
-            'movie/{movie_id}',
-            dict(movie_id=id_),
-            url_params=OrderedDict(append_to_response='credits'),
-        )
-        data = await self.get_data(url)
+        data = await self.get_data(self._urls['movie'].format(id_=id_))
         if data is None:
             return
-        return Movie.from_json(data, self.config['data'].get('images'))
+        return Movie.from_json(data, self.image_config)
+
+    async def get_movies(self, ids):
+        """Retrieve data for multiple movies concurrently.
+
+        Arguments:
+          ids (:py:class:`collections.abc.Iterable`): The movies' TMDb
+            IDs.
+
+        Returns:
+          :py:class:`list`: The requested :py:class:`~.Movie` objects,
+            in the same order as the IDs.
+
+        """
+        return await asyncio.gather(*(self.get_movie(id_) for id_ in ids))
 
     async def get_person(self, id_):
         """Retrieve person data by ID.
@@ -170,30 +690,34 @@ class TMDbClient(UrlParamMixin, Service):
           :py:class:`~.Person`: The requested person.
 
         """
-        data = await self._get_person_json(
-            id_,
-            OrderedDict(append_to_response='movie_credits')
-        )
-        return Person.from_json(data, self.config['data'].get('images'))
+        data = await self.get_data(self._urls['person_credits'].format(id_=id_))
+        return Person.from_json(data, self.image_config)
+
+    async def get_people(self, ids):
+        """Retrieve data for multiple people concurrently.
+
+        Arguments:
+          ids (:py:class:`collections.abc.Iterable`): The people's TMDb
+            IDs.
 
-    async def _get_person_json(self, id_, url_params=None):
+        Returns:
+          :py:class:`list`: The requested :py:class:`~.Person` objects,
+            in the same order as the IDs.
+
+        """
+        return await asyncio.gather(*(self.get_person(id_) for id_ in ids))
+
+    async def _get_person_json(self, id_):
         """Retrieve raw person JSON by ID.
 
         Arguments:
           id_ (:py:class:`int`): The person's TMDb ID.
-          url_params (:py:class:`dict`): Any additional URL parameters.
 
         Returns:
           :py:class:`dict`: The JSON data.
 
         """
-        url = self.url_builder(
-            'person/{person_id}',
-            dict(person_id=id_),
-            url_params=url_params or OrderedDict(),
-        )
-        data = await self.get_data(url)
-        return data
+        return await self.get_data(self._urls['person'].format(id_=id_))
 
     async def get_random_popular_person(self, limit=500):
         """Randomly select a popular person.
@@ -201,7 +725,8 @@ class TMDbClient(UrlParamMixin, Service):
         Notes:
           Requires at least two API calls. May require three API calls
           if the randomly-selected index isn't within the first page of
-          required data.
+          required data; in that case, the page expected to contain it
+          is requested at the same time as the first page.
 
         Arguments:
           limit (:py:class:`int`, optional): How many of the most
@@ -213,23 +738,37 @@ class TMDbClient(UrlParamMixin, Service):
 
         """
         index = random.randrange(limit)
-        data = await self._get_popular_people_page()
+        expected_page = (index // self.POPULAR_PAGE_SIZE) + 1
+        expected_data = None
+        if expected_page == 1:
+            data = await self._get_popular_people_page()
+        else:
+            data, expected_data = await asyncio.gather(
+                self._get_popular_people_page(),
+                self._get_popular_people_page(expected_page),
+            )
         if data is None:
             return
         if index >= len(data['results']):
             # result is not on first page
             page, index = self._calculate_page_index(index, data)
-            data = await self._get_popular_people_page(page)
+            if page == expected_page:
+                data = expected_data
+            else:
+                data = await self._get_popular_people_page(page)
         if data is None:
             return
         json_data = data['results'][index]
         details = await self._get_person_json(json_data['id'])
-        details.update(**json_data)
-        return Person.from_json(details, self.config['data'].get('images'))
+        return Person.from_json(dict(details, **json_data), self.image_config)
 
     async def _get_popular_people_page(self, page=1):
         """Get a specific page of popular person data.
 
+        Notes:
+          Pages are kept in memory for :py:attr:`POPULAR_LIFETIME`
+          seconds, as the popular people change slowly.
+
         Arguments:
           page (:py:class:`int`, optional): The page to get.
 
@@ -237,10 +776,17 @@ class TMDbClient(UrlParamMixin, Service):
           :py:class:`dict`: The page data.
 
         """
-        return await self.get_data(self.url_builder(
+        cached = self._popular_pages.get(page)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        data = await self.get_data(self.url_builder(
             'person/popular',
-            url_params=OrderedDict(page=page),
+            url_params={'page': page},
         ))
+        if data is not None:
+            expiry = time.monotonic() + self.POPULAR_LIFETIME
+            self._popular_pages[page] = (expiry, data)
+        return data
 
     @staticmethod
     def _calculate_page_index(index, data):
@@ -255,7 +801,7 @@ class TMDbClient(UrlParamMixin, Service):
             ``(page, index_in_page)``.
 
         """
-        if index > data['total_results']:
+        if index >= data['total_results']:
             raise ValueError('index not in paged data')
-        page_length = len(data['results'])
-        return (index // page_length) + 1, (index % page_length) - 1
+        page, index_in_page = divmod(index, len(data['results']))
+        return page + 1, index_in_page
@@ -8,10 +8,14 @@
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from os import getenv
+import re
+import time
 from urllib.parse import urlencode
 
-from dateutil.parser import parse
+MAX_AGE = re.compile(r'\bmax-age=(\d+)')
+NO_STORE = re.compile(r'\bno-store\b')
 
 
 class Service(metaclass=ABCMeta):
@@ -57,9 +61,65 @@ class Service(metaclass=ABCMeta):
             root = self.ROOT
         return ''.join([
             root,
-            endpoint,
+            endpoint.format_map(params) if params else endpoint,
             '?' + urlencode(url_params) if url_params else '',
-        ]).format(**params or {})
+        ])
+
+    @staticmethod
+    def calculate_max_age(cache_control):
+        """Extract the cache lifetime from a ``Cache-Control`` header.
+
+        Arguments:
+          cache_control (:py:class:`str`): The header value, or
+            ``None`` if it wasn't provided.
+
+        Returns:
+          :py:class:`int`: The lifetime, in seconds, or ``None`` if the
+            header doesn't specify one.
+
+        """
+        if cache_control is None:
+            return
+        match = MAX_AGE.search(cache_control)
+        if match is not None:
+            return int(match.group(1))
+
+    @classmethod
+    def calculate_cache_lifetime(cls, headers):
+        """Determine how long a response may be cached for.
+
+        Notes:
+          Per :rfc:`7234#section-5.3`, the ``Cache-Control`` header's
+          ``max-age`` takes precedence over the ``Expires`` header.
+
+        Arguments:
+          headers (:py:class:`collections.abc.Mapping`): The response
+            headers.
+
+        Returns:
+          :py:class:`int`: The lifetime, in seconds (``0`` if the
+            response must not be cached), or ``None`` if the headers
+            don't specify one.
+
+        """
+        cache_control = headers.get('Cache-Control')
+        if cache_control is not None and NO_STORE.search(cache_control):
+            return 0
+        max_age = cls.calculate_max_age(cache_control)
+        if max_age is not None:
+            return max_age
+        expires = headers.get('Expires')
+        if expires is None:
+            return
+        try:
+            date_expires = parsedate_to_datetime(expires)
+        except (TypeError, ValueError):
+            # invalid dates (e.g. "0") mean already expired
+            return 0
+        if date_expires.tzinfo is None:
+            date_expires = date_expires.replace(tzinfo=timezone.utc)
+        utc_now = datetime.now(tz=timezone.utc)
+        return max(int((date_expires - utc_now).total_seconds()), 0)
 
     @staticmethod
     def calculate_timeout(http_date):
@@ -74,15 +134,85 @@ class Service(metaclass=ABCMeta):
           http_date (:py:class:`str`): The date to parse.
 
         Returns:
-          :py:class:`int`: The timeout, in seconds.
+          :py:class:`int`: The timeout, in seconds (``0`` if the date
+          has already passed), or ``None`` if it can't be parsed.
 
         """
         try:
             return int(http_date)
         except ValueError:
-            date_after = parse(http_date)
+            pass
+        try:
+            date_after = parsedate_to_datetime(http_date)
+        except (TypeError, ValueError):
+            return
+        if date_after.tzinfo is None:
+            date_after = date_after.replace(tzinfo=timezone.utc)
         utc_now = datetime.now(tz=timezone.utc)
-        return int((date_after - utc_now).total_seconds())
+        return max(0, int((date_after - utc_now).total_seconds()))
+
+
+class MemoryCache:
+    """Simple in-process cache with per-entry expiry.
+
+    Notes:
+      Exposes the same ``get`` and ``set`` interface as e.g.
+      :py:class:`diskcache.Cache`, so can be used as a service cache.
+
+    Arguments:
+      maxsize (:py:class:`int`, optional): The maximum number of
+        entries to keep (defaults to ``4096``); the least recently used
+        entries are evicted first.
+
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def get(self, key, default=None):
+        """Get an entry from the cache, if it hasn't expired.
+
+        Arguments:
+          key: The key to look up.
+          default (optional): The value to return if the key is
+            missing or has expired (defaults to ``None``).
+
+        """
+        try:
+            value, expiry = self._data[key]
+        except KeyError:
+            return default
+        if expiry is not None and expiry <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, expire=None):
+        """Add an entry to the cache.
+
+        Arguments:
+          key: The key to store the value under.
+          value: The value to store.
+          expire (:py:class:`int`, optional): How long to keep the
+            entry, in seconds (defaults to ``None``, meaning forever).
+
+        """
+        self._data[key] = (
+            value,
+            None if expire is None else time.monotonic() + expire,
+        )
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
 
 
 class TokenAuthMixin:
@@ -116,13 +246,18 @@ class UrlParamMixin(TokenAuthMixin):
     AUTH_PARAM = None
     """:py:class:`str`: The name of the URL parameter."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._auth_query = urlencode({self.AUTH_PARAM: self.api_token})
+
     def url_builder(self, endpoint, params=None, url_params=None):
         """Add authentication URL parameter."""
-        if url_params is None:
-            url_params = OrderedDict()
-        url_params[self.AUTH_PARAM] = self.api_token
-        return super().url_builder(
-            endpoint,
-            params=params,
-            url_params=url_params,
+        return '{}{}{}'.format(
+            super().url_builder(
+                endpoint,
+                params=params,
+                url_params=url_params,
+            ),
+            '&' if url_params else '?',
+            self._auth_query,
         )
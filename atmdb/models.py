@@ -1,12 +1,242 @@
 """Models representing TMDb resources."""
-from datetime import date, datetime
+from bisect import bisect_left
+from datetime import date
+from functools import lru_cache
 import logging
+from operator import itemgetter
 from textwrap import dedent
-
-from dateutil.relativedelta import relativedelta
+from types import MappingProxyType
+from weakref import WeakValueDictionary
 
 logger = logging.getLogger(__name__)
 
+NON_NUMERIC_DISTANCE = 999
+"""The distance from any target used for non-numeric sizes."""
+
+_INSTANCES = WeakValueDictionary()
+"""The live model instances created from JSON, keyed by class and ID."""
+
+_MODELS = {}
+"""The model classes, keyed by name."""
+
+
+@lru_cache()
+def _size_index(sizes):
+    """Create a sorted index of the available image sizes.
+
+    Arguments:
+      sizes (:py:class:`tuple`): The available sizes (e.g. ``'w185'``,
+        ``'h632'`` or ``'original'``).
+
+    Returns:
+      :py:class:`tuple`: The sorted numeric sizes, their corresponding
+        size names and the first non-numeric size name (or ``None``).
+
+    """
+    numeric = sorted(
+        ((int(size[1:]), size) for size in sizes if size[:1] in ('w', 'h')),
+        key=itemgetter(0),
+    )
+    other = next((size for size in sizes if size[:1] not in ('w', 'h')), None)
+    return tuple(value for value, _ in numeric), tuple(
+        size for _, size in numeric
+    ), other
+
+
+def _parse_date(date_str):
+    """Parse a TMDb ``YYYY-MM-DD`` date string.
+
+    Arguments:
+      date_str (:py:class:`str`): The date string.
+
+    Returns:
+      :py:class:`datetime.date`: The date, or ``None`` if the string
+        is empty or malformed.
+
+    """
+    if not date_str:
+        return
+    try:
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except ValueError:
+        logger.warning('invalid date %r', date_str)
+
+
+def _years_between(start, end):
+    """Calculate the number of whole years between two dates.
+
+    Arguments:
+      start (:py:class:`datetime.date`): The earlier date.
+      end (:py:class:`datetime.date`): The later date.
+
+    Returns:
+      :py:class:`int`: The number of years.
+
+    """
+    return end.year - start.year - (
+        (end.month, end.day) < (start.month, start.day)
+    )
+
+
+def _json_items(json_mapping):
+    """Resolve the JSON keys for each attribute in a mapping.
+
+    Arguments:
+      json_mapping (:py:class:`dict`): The mapping between attributes
+        and JSON keys (``None`` to use the attribute name).
+
+    Returns:
+      :py:class:`tuple`: The ``(attribute, json_key)`` pairs.
+
+    """
+    return tuple(
+        (attr, attr if key is None else key)
+        for attr, key in json_mapping.items()
+    )
+
+
+@lru_cache(maxsize=64)
+def _url_prefix(base_url, size):
+    """Create the URL prefix for images of a given size.
+
+    Arguments:
+      base_url (:py:class:`str`): The base URL for images.
+      size (:py:class:`str`): The name of the image size.
+
+    Returns:
+      :py:class:`str`: The prefix for the image file paths.
+
+    """
+    return base_url + size
+
+
+def _repr_format(name, json_mapping):
+    """Create the format string for a model's representation.
+
+    Arguments:
+      name (:py:class:`str`): The name of the model class.
+      json_mapping (:py:class:`dict`): The mapping between attributes
+        and JSON keys.
+
+    Returns:
+      :py:class:`str`: The format string, with a positional field for
+        each attribute.
+
+    """
+    return '{}({})'.format(
+        name,
+        ', '.join('{}={{!r}}'.format(attr) for attr in json_mapping),
+    )
+
+
+@lru_cache()
+def _closest_size(sizes, target_size):
+    """Find the closest available size to the target.
+
+    Arguments:
+      sizes (:py:class:`tuple`): The available sizes.
+      target_size (:py:class:`int`): The size of image to aim for (used
+        as either width or height).
+
+    Returns:
+      :py:class:`str`: The name of the closest size.
+
+    """
+    values, names, other = _size_index(sizes)
+    if not values:
+        return other
+    index = bisect_left(values, target_size)
+    if index == len(values) or (
+            index and
+            target_size - values[index - 1] <= values[index] - target_size
+    ):
+        index -= 1
+    if (other is not None and
+            abs(target_size - values[index]) > NON_NUMERIC_DISTANCE):
+        return other
+    return names[index]
+
+
+class _Deferred:
+    """The raw JSON for related models that haven't been built yet."""
+
+    __slots__ = ('json',)
+
+    def __init__(self, json):
+        self.json = json
+
+
+class _Related:
+    """Descriptor for related models, which can be built on demand.
+
+    Notes:
+      The owning class must declare a slot named for the attribute
+      with a leading underscore, in which the value is stored.
+
+    Arguments:
+      build (:py:func:`callable`): Function to build the related
+        models from the raw JSON list and the image configuration.
+
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.__doc__ = build.__doc__
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = owner.__dict__['_{}'.format(name)]
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if isinstance(value, _Deferred):
+            value = self.build(value.json, instance.image_config)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def from_json(self, json, image_config, eager):
+        """Build the related models, or defer building them.
+
+        Arguments:
+          json (:py:class:`list`): The raw JSON for the related models.
+          image_config (:py:class:`dict`): The API image configuration
+            data.
+          eager (:py:class:`bool`): Whether to build the models now.
+
+        Returns:
+          :py:class:`set`: The related models (or a placeholder to
+            build them on first access), or ``None`` if there are none.
+
+        """
+        if not json:
+            return
+        if eager:
+            return self.build(json, image_config)
+        return _Deferred(json)
+
+
+def _build_cast(json, image_config):
+    """:py:class:`set`: The movie's cast."""
+    return Person.from_json_batch(json, image_config)
+
+
+def _build_known_for(json, image_config):
+    """:py:class:`set`: The movies the person is best known for."""
+    return Movie.from_json_batch(
+        (movie for movie in json if movie.get('media_type') == 'movie'),
+        image_config,
+    )
+
+
+def _build_movie_credits(json, image_config):
+    """:py:class:`set`: The person's movie credits."""
+    return Movie.from_json_batch(json, image_config)
+
 
 class BaseModel:
     """Base TMDb model functionality.
@@ -14,36 +244,51 @@ class BaseModel:
     Arguments:
       id_ (:py:class:`int`): The TMDb ID of the object.
       image_path (:py:class:`str`): The short path to the image.
+      image_config (:py:class:`dict`, optional): The API image
+        configuration.
 
     Attributes:
       image_url (:py:class:`str`): The fully-qualified image URL.
 
     """
 
+    __slots__ = ('__weakref__', '_image_url', 'id_', 'image_config', 'image_path')
+
     CONTAINS = None
-    """:py:class:`dict`: Rules for what the model contains."""
+    """:py:class:`types.MappingProxyType`: Rules for what the model
+    contains."""
 
     IMAGE_TYPE = None
     """:py:class:`str`: The type of image to use."""
 
-    JSON_MAPPING = dict(id_='id')
-    """:py:class:`dict`: The mapping between JSON keys and attributes."""
+    JSON_MAPPING = MappingProxyType(dict(id_='id'))
+    """:py:class:`types.MappingProxyType`: The mapping between JSON keys
+    and attributes."""
+
+    _JSON_ITEMS = _json_items(JSON_MAPPING)
 
-    image_config = None
-    """:py:class:`dict`: The API image configuration."""
+    _REPR_FORMAT = _repr_format('BaseModel', JSON_MAPPING)
 
-    def __init__(self, *, id_, image_path=None, **_):
+    def __init__(self, *, id_, image_path=None, image_config=None, **_):
         self.id_ = id_
+        self.image_config = image_config
         self.image_path = image_path
+        self._image_url = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._JSON_ITEMS = _json_items(cls.JSON_MAPPING)
+        cls._REPR_FORMAT = _repr_format(cls.__name__, cls.JSON_MAPPING)
+        _MODELS[cls.__name__] = cls
 
     def __contains__(self, item):
         if self.CONTAINS is None:
             return False
-        attr = self.CONTAINS['attr']
-        subclasses = {obj.__name__: obj for obj in
-                      BaseModel.__subclasses__()}  # pylint: disable=no-member
-        cls = subclasses[self.CONTAINS['type']]
-        return isinstance(item, cls) and item in getattr(self, attr)
+        cls = _MODELS[self.CONTAINS['type']]
+        return isinstance(item, cls) and item in getattr(
+            self,
+            self.CONTAINS['attr'],
+        )
 
     def __eq__(self, other):
         return isinstance(other, type(self)) and self.id_ == other.id_
@@ -52,15 +297,19 @@ class BaseModel:
         return hash(self.id_)
 
     def __repr__(self):
-        return '{}({})'.format(
-            self.__class__.__name__,
-            ', '.join(['{}={!r}'.format(attr, getattr(self, attr))
-                       for attr in self.JSON_MAPPING]),
+        return self._REPR_FORMAT.format(
+            *(getattr(self, attr) for attr, _ in self._JSON_ITEMS)
         )
 
     @property
     def image_url(self):
-        return self._create_image_url(self.image_path, self.IMAGE_TYPE, 200)
+        if self._image_url is None:
+            self._image_url = self._create_image_url(
+                self.image_path,
+                self.IMAGE_TYPE,
+                200,
+            )
+        return self._image_url
 
     def _create_image_url(self, file_path, type_, target_size):
         """The the closest available size for specified image type.
@@ -76,18 +325,56 @@ class BaseModel:
         if self.image_config is None:
             logger.warning('no image configuration available')
             return
-        return ''.join([
+        return _url_prefix(
             self.image_config['secure_base_url'],
             self._image_size(self.image_config, type_, target_size),
-            file_path,
-        ])
+        ) + file_path
 
     @classmethod
     def from_json(cls, json, image_config=None):
         """Create a model instance
 
+        Notes:
+          If an instance with the same ID is still alive, it is updated
+          with any values present in the JSON and reused, rather than
+          creating a duplicate. Instances without an ID are never
+          reused.
+
+        Arguments:
+          json (:py:class:`dict`): The parsed JSON data.
+          image_config (:py:class:`dict`): The API image configuration
+            data.
+
+        Returns:
+          :py:class:`BaseModel`: The model instance.
+
+        """
+        return cls._from_kwargs(cls._json_kwargs(json), image_config)
+
+    @classmethod
+    def _json_kwargs(cls, json):
+        """Extract the instance arguments from the JSON data.
+
+        Notes:
+          The JSON data isn't modified, as it may be shared (e.g. with
+          a cached response).
+
         Arguments:
           json (:py:class:`dict`): The parsed JSON data.
+
+        Returns:
+          :py:class:`dict`: The keyword arguments for the instance.
+
+        """
+        return {attr: json.get(key) for attr, key in cls._JSON_ITEMS}
+
+    @classmethod
+    def _from_kwargs(cls, kwargs, image_config):
+        """Create or update a model instance from its arguments.
+
+        Arguments:
+          kwargs (:py:class:`dict`): The keyword arguments for the
+            instance.
           image_config (:py:class:`dict`): The API image configuration
             data.
 
@@ -95,11 +382,39 @@ class BaseModel:
           :py:class:`BaseModel`: The model instance.
 
         """
-        cls.image_config = image_config
-        return cls(**{
-            attr: json.get(attr if key is None else key)
-            for attr, key in cls.JSON_MAPPING.items()
-        })
+        id_ = kwargs['id_']
+        if id_ is None:
+            return cls(image_config=image_config, **kwargs)
+        instance = _INSTANCES.get((cls, id_))
+        if instance is None:
+            instance = cls(image_config=image_config, **kwargs)
+            _INSTANCES[cls, id_] = instance
+            return instance
+        for attr, value in kwargs.items():
+            if value is not None:
+                setattr(instance, attr, value)
+        if image_config is not None:
+            instance.image_config = image_config
+        instance._image_url = None  # pylint: disable=protected-access
+        return instance
+
+    @classmethod
+    def from_json_batch(cls, json, image_config=None):
+        """Create a set of model instances.
+
+        Arguments:
+          json (:py:class:`collections.abc.Iterable`): The parsed JSON
+            data for each instance.
+          image_config (:py:class:`dict`): The API image configuration
+            data.
+
+        Returns:
+          :py:class:`frozenset`: The model instances, or ``None`` if
+            there are none.
+
+        """
+        from_json = cls.from_json
+        return frozenset(from_json(item, image_config) for item in json) or None
 
     @staticmethod
     def _image_size(image_config, type_, target_size):
@@ -113,11 +428,9 @@ class BaseModel:
             as either width or height).
 
         """
-        return min(
-            image_config['{}_sizes'.format(type_)],
-            key=lambda size: (abs(target_size - int(size[1:]))
-                              if size.startswith('w') or size.startswith('h')
-                              else 999),
+        return _closest_size(
+            tuple(image_config['{}_sizes'.format(type_)]),
+            target_size,
         )
 
 
@@ -136,18 +449,35 @@ class Movie(BaseModel):
 
     """
 
-    CONTAINS = dict(attr='cast', image_path='poster_path', type='Person')
+    __slots__ = ('_cast', 'release_date', 'synopsis', 'title')
+
+    CONTAINS = MappingProxyType(dict(
+        attr='cast',
+        image_path='poster_path',
+        type='Person',
+    ))
 
     IMAGE_TYPE = 'poster'
 
-    JSON_MAPPING = dict(
+    _URL_TEMPLATE = 'https://www.themoviedb.org/movie/{0.id_}'
+
+    _SHORT_TEMPLATE = '{0.title} [' + _URL_TEMPLATE + ']'
+
+    _TEMPLATE = dedent("""
+    *{0.title}*
+
+    {0.synopsis}
+
+    For more information see:""").strip() + ' ' + _URL_TEMPLATE
+
+    JSON_MAPPING = MappingProxyType(dict(
         cast=None,
         image_path='{}_path'.format(IMAGE_TYPE),
         release_date=None,
         synopsis='overview',
         title='original_title',
         **BaseModel.JSON_MAPPING,
-    )
+    ))
 
     def __init__(self, *, title, cast=None, synopsis=None, release_date=None,
                  **kwargs):
@@ -159,33 +489,42 @@ class Movie(BaseModel):
 
     def __str__(self):
         if self.synopsis is None:
-            return "{0.title} [{0.url}]".format(self)
-        return dedent("""
-        *{0.title}*
-
-        {0.synopsis}
+            return self._SHORT_TEMPLATE.format(self)
+        return self._TEMPLATE.format(self)
 
-        For more information see: {0.url}
-        """).strip().format(self)
+    cast = _Related(_build_cast)
 
     @property
     def url(self):
-        return 'https://www.themoviedb.org/movie/{}'.format(self.id_)
+        return self._URL_TEMPLATE.format(self)
 
     @property
     def release_year(self):
         return None if self.release_date is None else self.release_date.year
 
     @classmethod
-    def from_json(cls, json, image_config=None):
-        json['cast'] = {
-            Person.from_json(person, image_config) for person in
-            json.get('credits', {}).get('cast', [])
-        } or None
-        release = json.get('release_date')
-        json['release_date'] = (None if not release else
-                                datetime.strptime(release, '%Y-%m-%d').date())
-        return super().from_json(json, image_config)
+    def from_json(cls, json, image_config=None, eager=True):  # pylint: disable=arguments-differ
+        """Create a movie instance.
+
+        Arguments:
+          json (:py:class:`dict`): The parsed JSON data.
+          image_config (:py:class:`dict`): The API image configuration
+            data.
+          eager (:py:class:`bool`, optional): Whether to build the cast
+            now, rather than on first access (defaults to ``True``).
+
+        Returns:
+          :py:class:`Movie`: The model instance.
+
+        """
+        kwargs = cls._json_kwargs(json)
+        kwargs['cast'] = cls.cast.from_json(
+            json.get('credits', {}).get('cast'),
+            image_config,
+            eager,
+        )
+        kwargs['release_date'] = _parse_date(kwargs['release_date'])
+        return cls._from_kwargs(kwargs, image_config)
 
 
 class Person(BaseModel):
@@ -211,11 +550,31 @@ class Person(BaseModel):
 
     """
 
-    CONTAINS = dict(attr='movie_credits', type='Movie')
+    __slots__ = (
+        'biography',
+        'birthday',
+        'deathday',
+        '_known_for',
+        '_movie_credits',
+        'name',
+    )
+
+    CONTAINS = MappingProxyType(dict(attr='movie_credits', type='Movie'))
 
     IMAGE_TYPE = 'profile'
 
-    JSON_MAPPING = dict(
+    _URL_TEMPLATE = 'https://www.themoviedb.org/person/{0.id_}'
+
+    _SHORT_TEMPLATE = '{0.name} [' + _URL_TEMPLATE + ']'
+
+    _TEMPLATE = dedent("""
+    *{0.name}*
+
+    {0.biography}
+
+    For more information see:""").strip() + ' ' + _URL_TEMPLATE
+
+    JSON_MAPPING = MappingProxyType(dict(
         biography=None,
         birthday=None,
         deathday=None,
@@ -224,7 +583,7 @@ class Person(BaseModel):
         known_for=None,
         name=None,
         **BaseModel.JSON_MAPPING,
-    )
+    ))
 
     def __init__(self, name, biography=None, movie_credits=None, known_for=None,
                  birthday=None, deathday=None, **kwargs):
@@ -238,48 +597,60 @@ class Person(BaseModel):
 
     def __str__(self):
         if self.biography is None:
-            return "{0.name} [{0.url}]".format(self)
-        return dedent("""
-        *{0.name}*
-
-        {0.biography}
-
-        For more information see: {0.url}
-        """).strip().format(self)
+            return self._SHORT_TEMPLATE.format(self)
+        return self._TEMPLATE.format(self)
 
     @property
     def age(self):
         if self.birthday is None:
             return
         if self.deathday is None:
-            return relativedelta(date.today(), self.birthday).years
-        return relativedelta(self.deathday, self.birthday).years
+            return _years_between(self.birthday, date.today())
+        return _years_between(self.birthday, self.deathday)
 
     @property
     def alive(self):
         return self.deathday is None
 
+    known_for = _Related(_build_known_for)
+
+    movie_credits = _Related(_build_movie_credits)
+
     @property
     def url(self):
-        return 'https://www.themoviedb.org/person/{}'.format(self.id_)
+        return self._URL_TEMPLATE.format(self)
 
     @classmethod
-    def from_json(cls, json, image_config=None):
-        json['movie_credits'] = {
-            Movie.from_json(movie, image_config) for movie in
-            json.get('movie_credits', {}).get('cast', [])
-        } or None
-        json['known_for'] = {
-            Movie.from_json(movie, image_config)
-            for movie in json.get('known_for', [])
-            if movie.get('media_type') == 'movie'
-        } or None
-        json['birthday'] = cls.extract_date(json.get('birthday'))
-        json['deathday'] = cls.extract_date(json.get('deathday'))
-        return super().from_json(json, image_config)
+    def from_json(cls, json, image_config=None, eager=True):  # pylint: disable=arguments-differ
+        """Create a person instance.
+
+        Arguments:
+          json (:py:class:`dict`): The parsed JSON data.
+          image_config (:py:class:`dict`): The API image configuration
+            data.
+          eager (:py:class:`bool`, optional): Whether to build the movie
+            credits now, rather than on first access (defaults to
+            ``True``).
+
+        Returns:
+          :py:class:`Person`: The model instance.
+
+        """
+        kwargs = cls._json_kwargs(json)
+        kwargs['movie_credits'] = cls.movie_credits.from_json(
+            json.get('movie_credits', {}).get('cast'),
+            image_config,
+            eager,
+        )
+        kwargs['known_for'] = cls.known_for.from_json(
+            kwargs['known_for'],
+            image_config,
+            eager,
+        )
+        kwargs['birthday'] = cls.extract_date(kwargs['birthday'])
+        kwargs['deathday'] = cls.extract_date(kwargs['deathday'])
+        return cls._from_kwargs(kwargs, image_config)
 
     @staticmethod
     def extract_date(date_str):
-        if not date_str:
-            return
-        return datetime.strptime(date_str, '%Y-%m-%d').date()
+        return _parse_date(date_str)
@@ -1,4 +1,5 @@
 """Utilities for working with TMDb models."""
+import asyncio
 
 
 async def overlapping_movies(people, client=None):
@@ -37,8 +38,8 @@ async def find_overlapping_movies(names, client):
 
     Warning:
       This function requires two API calls per name submitted, plus
-      one API call per overlapping movie in the result; it is therefore
-      relatively slow.
+      one API call per overlapping movie in the result; although
+      these are made concurrently, it is therefore relatively slow.
 
     Arguments:
       names (:py:class:`collections.abc.Sequence`): The names of the
@@ -58,8 +59,8 @@ async def find_overlapping_actors(titles, client):
 
     Warning:
       This function requires two API calls per title submitted, plus
-      one API call per overlapping person in the result; it is therefore
-      relatively slow.
+      one API call per overlapping person in the result; although
+      these are made concurrently, it is therefore relatively slow.
 
     Arguments:
       titles (:py:class:`collections.abc.Sequence`): The titles of the
@@ -88,17 +89,55 @@ async def _overlap(items, overlap_attr, client=None, get_method=None):
         client to use for extracting additional information.
 
     Returns:
-      :py:class:`list`: The relevant result objects.
+      :py:class:`collections.abc.Collection`: The relevant result
+        objects (a :py:class:`frozenset` of the overlap if there is no
+        client, otherwise a :py:class:`list` of the detailed results).
 
     """
-    overlap = set.intersection(*(getattr(item, overlap_attr) for item in items))
+    overlap = _overlap_items(items, overlap_attr)
     if client is None or get_method is None:
         return overlap
-    results = []
-    for item in overlap:
-        result = await getattr(client, get_method)(id_=item.id_)
-        results.append(result)
-    return results
+    return await _fetch_details(overlap, client, get_method)
+
+
+def _overlap_items(items, overlap_attr):
+    """Find the overlap between the items, without any API calls.
+
+    Arguments:
+      item (:py:class:`collections.abc.Sequence`): The objects to
+        find overlaps for.
+      overlap_attr (:py:class:`str`): The attribute of the items to use
+        as input for the overlap.
+
+    Returns:
+      :py:class:`frozenset`: The overlapping objects.
+
+    """
+    smallest, *others = sorted(
+        (getattr(item, overlap_attr) for item in items),
+        key=len,
+    )
+    return frozenset(smallest.intersection(*others))
+
+
+async def _fetch_details(items, client, get_method):
+    """Get detailed information on the items concurrently.
+
+    Arguments:
+      items (:py:class:`collections.abc.Iterable`): The objects to get
+        details for.
+      client (:py:class:`~.TMDbClient`): The TMDb client.
+      get_method (:py:class:`str`): The method of the client to use
+        for extracting additional information.
+
+    Returns:
+      :py:class:`list`: The detailed result objects (any that couldn't
+        be retrieved are omitted).
+
+    """
+    get = getattr(client, get_method)
+    details = await asyncio.gather(*(get(id_=item.id_) for item in items))
+    return [detail for detail in details if detail is not None]
 
 
 async def _find_overlap(queries, client, find_method, get_method,
@@ -117,11 +156,15 @@ async def _find_overlap(queries, client, find_method, get_method,
         function to call for the resulting overlap.
 
     """
-    results = []
-    for query in queries:
-        candidates = await getattr(client, find_method)(query)
+    find = getattr(client, find_method)
+    found = await asyncio.gather(*(find(query) for query in queries))
+    for query, candidates in zip(queries, found):
         if not candidates:
             raise ValueError('no result found for {!r}'.format(query))
-        result = await getattr(client, get_method)(id_=candidates[0].id_)
-        results.append(result)
-    return await overlap_function(results, client)
+    ids = [candidates[0].id_ for candidates in found]
+    unique_ids = list(dict.fromkeys(ids))
+    get = getattr(client, get_method)
+    details = dict(zip(unique_ids, await asyncio.gather(
+        *(get(id_=id_) for id_ in unique_ids)
+    )))
+    return await overlap_function([details[id_] for id_ in ids], client)
@@ -1,4 +1,5 @@
 from datetime import datetime
+import time
 
 import pytest
 
@@ -13,6 +14,19 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: mark test as slow to run")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def config():
     return dict(
@@ -37,4 +51,5 @@ def token():
 def client(config, token):
     instance = TMDbClient(api_token=token)
     instance.config = config
+    instance._config_expiry = time.monotonic() + TMDbClient.CONFIG_LIFETIME
     return instance
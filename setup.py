@@ -61,19 +61,20 @@ setup(
         'Intended Audience :: Developers',
         'Natural Language :: English',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3 :: Only',
     ],
     cmdclass={'test': PyTest},
     description=description,
-    install_requires=['aiohttp', 'python-dateutil'],
+    extras_require={'speedups': ['orjson']},
+    install_requires=['aiohttp>=3.3'],
     license='License :: OSI Approved :: ISC License (ISCL)',
     long_description=long_description,
     name=PKG_NAME,
     packages=[PKG_NAME],
     platforms='any',
     tests_require=[
-        'asynctest',
         'pylint',
         'pytest',
         'pytest-asyncio',
@@ -1,23 +1,22 @@
-import asyncio
 import json
 
 
-def future_from(result):
-    future = asyncio.Future()
-    future.set_result(result)
-    return future
-
-
 class SimpleSessionMock:
 
     call_args_list = []
 
+    request_headers = []
+
     # mocking
 
     @classmethod
     def configure_mock(cls, *, side_effect=None):
-        cls.side_effect = side_effect
+        cls.side_effect = side_effect and [
+            dict(data, encoded=data.get('text', json.dumps(data.get('body'))))
+            for data in side_effect
+        ]
         cls.call_args_list = []
+        cls.request_headers = []
 
     @classmethod
     def assert_called_with(cls, url, *, headers=None):
@@ -25,20 +24,29 @@ class SimpleSessionMock:
 
     # asyncio.ClientSession
 
-    def __init__(self, **kwargs):
+    def __init__(self, *, connector=None, headers=None, timeout=None, **kwargs):
         if kwargs:
             raise ValueError('configuration not implemented')
+        self.connector = connector
+        self.session_headers = headers
+        self.timeout = timeout
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
 
     def get(self, url, *, headers=None, **kwargs):
         if kwargs:
             raise ValueError('configuration not implemented')
+        type(self).request_headers.append(headers)
+        headers = self.session_headers
         if not self.side_effect:
             raise ValueError('unexpected GET call with %r', (url, headers))
         data = self.side_effect.pop(0)
         self._code = data.get('code')
-        self._body = data.get('body')
-        self._headers = data.get('headers')
-        SimpleSessionMock.call_args_list.append(dict(url=url, headers=headers))
+        self._encoded = data['encoded']
+        self._headers = data.get('headers', {})
+        type(self).call_args_list.append(dict(url=url, headers=headers))
         return self
 
     def __enter__(self):
@@ -55,8 +63,10 @@ class SimpleSessionMock:
     async def __aexit__(self, *_):
         pass
 
-    async def read(self):
-        return json.dumps(self._body).encode('utf-8')
+    async def json(self, *, loads=json.loads, content_type='application/json'):
+        if not self._encoded.strip():
+            return None
+        return loads(self._encoded)
 
     @property
     def headers(self):
@@ -65,3 +75,15 @@ class SimpleSessionMock:
     @property
     def status(self):
         return self._code
+
+
+class SimpleCache(dict):
+    """Minimal stand-in for e.g. a :py:class:`diskcache.Cache`."""
+
+    def __init__(self):
+        super().__init__()
+        self.expiry = {}
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+        self.expiry[key] = expire
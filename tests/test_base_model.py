@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from atmdb.models import BaseModel
@@ -27,11 +29,20 @@ def test_create_image_url_no_config(base_model):
     assert base_model._create_image_url('foo', 'bar', 123) is None
 
 
+def test_image_config_per_instance(config):
+    configured = BaseModel.from_json(dict(id=1), config['data']['images'])
+    unconfigured = BaseModel.from_json(dict(id=2))
+    assert configured.image_config == config['data']['images']
+    assert unconfigured.image_config is None
+
+
 @pytest.mark.parametrize('type_,target,expected', [
     ('poster', 300, 'w342'),
     ('poster', 500, 'w500'),
     ('profile', 300, 'w185'),
     ('profile', 500, 'h632'),
+    ('poster', 2000, 'original'),
+    ('profile', 10, 'w45'),
 ])
 def test_image_size(config, base_model, type_, target, expected):
     assert base_model._image_size(
@@ -39,3 +50,10 @@ def test_image_size(config, base_model, type_, target, expected):
         type_,
         target,
     ) == expected
+
+
+def test_image_url_cached(base_model):
+    with mock.patch.object(BaseModel, '_create_image_url', return_value='url') as create:
+        assert base_model.image_url == 'url'
+        assert base_model.image_url == 'url'
+        create.assert_called_once_with(None, None, 200)
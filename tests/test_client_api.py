@@ -1,12 +1,16 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+from copy import deepcopy
+from datetime import date, datetime, timedelta, timezone
 from http import HTTPStatus
+import time
+from unittest import mock
 
-from asynctest import mock
 import pytest
 
 from atmdb import TMDbClient
+from atmdb.core import MemoryCache
 
-from tests.helpers import future_from, SimpleSessionMock
+from tests.helpers import SimpleCache, SimpleSessionMock
 
 
 def test_client_instantiation(client, token):
@@ -28,6 +32,23 @@ def test_client_auth(client, token):
     assert client.url_builder('endpoint') == expected
 
 
+def test_client_url_params_not_formatted(client, token):
+    expected = (
+        'https://api.themoviedb.org/3/movie/123'
+        '?query=%7Bbraces%7D&api_key={}'.format(token)
+    )
+    assert client.url_builder(
+        'movie/{id_}',
+        params={'id_': 123},
+        url_params={'query': '{braces}'},
+    ) == expected
+
+
+def test_client_headers_cached(client):
+    assert client.headers == {'Accept': 'application/json'}
+    assert client.headers is client.headers
+
+
 def test_calculate_timeout_delta_seconds():
     assert TMDbClient.calculate_timeout('120') == 120
 
@@ -40,6 +61,34 @@ def test_calculate_timeout_http_date():
     ) <= 181
 
 
+def test_calculate_timeout_http_date_passed():
+    a_minute_ago = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
+    http_date = '%a, %d %b %Y %H:%M:%S %Z'
+    assert TMDbClient.calculate_timeout(a_minute_ago.strftime(http_date)) == 0
+
+
+def test_calculate_timeout_http_date_unknown_zone():
+    three_minutes_later = datetime.now(tz=timezone.utc) + timedelta(minutes=3)
+    http_date = '%a, %d %b %Y %H:%M:%S -0000'
+    assert 179 <= TMDbClient.calculate_timeout(
+        three_minutes_later.strftime(http_date),
+    ) <= 181
+
+
+def test_calculate_timeout_invalid():
+    assert TMDbClient.calculate_timeout('not a date') is None
+
+
+@pytest.mark.parametrize('cache_control,expected', [
+    (None, None),
+    ('public', None),
+    ('public, max-age=600', 600),
+    ('max-age=20, must-revalidate', 20),
+])
+def test_calculate_max_age(cache_control, expected):
+    assert TMDbClient.calculate_max_age(cache_control) == expected
+
+
 @pytest.mark.asyncio
 async def test_get_data_ok(client):
     with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
@@ -52,12 +101,14 @@ async def test_get_data_ok(client):
 
         assert data == payload
         assert len(session.call_args_list) == 1
-        session.assert_called_with('dummy_url', headers=client.headers)
+        assert session.assert_called_with('dummy_url', headers=client.headers)
 
 
 @pytest.mark.asyncio
 async def test_get_data_too_many_requests(client):
-    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
         payload = {'some': 'data'}
         session.configure_mock(side_effect=[
             dict(code=HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': 1}),
@@ -68,7 +119,135 @@ async def test_get_data_too_many_requests(client):
 
         assert data == payload
         assert len(session.call_args_list) == 2
-        session.assert_called_with('dummy_url', headers=client.headers)
+        assert session.assert_called_with('dummy_url', headers=client.headers)
+        sleep.assert_called_once_with(1.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_too_many_requests_http_date(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch.object(TMDbClient, 'calculate_timeout', return_value=120) as timeout, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        retry_after = 'Thu, 15 Oct 2026 12:02:00 GMT'
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': retry_after}),
+            dict(code=HTTPStatus.OK, body={}),
+        ])
+
+        await client.get_data('dummy_url')
+
+        timeout.assert_called_once_with(retry_after)
+        sleep.assert_called_once_with(120.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_too_many_requests_no_retry_after(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.TOO_MANY_REQUESTS, body={}),
+            dict(code=HTTPStatus.OK, body=payload),
+        ])
+
+        data = await client.get_data('dummy_url')
+
+        assert data == payload
+        sleep.assert_called_once_with(1.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_too_many_requests_invalid_retry_after(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': 'not a date'}),
+            dict(code=HTTPStatus.OK, body=payload),
+        ])
+
+        data = await client.get_data('dummy_url')
+
+        assert data == payload
+        sleep.assert_called_once_with(1.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_server_error_retried(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.BAD_GATEWAY, body={}),
+            dict(code=HTTPStatus.OK, body=payload),
+        ])
+
+        data = await client.get_data('dummy_url')
+
+        assert data == payload
+        assert len(session.call_args_list) == 2
+        sleep.assert_called_once_with(1.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_server_error_without_json_retried(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.SERVICE_UNAVAILABLE, text='<html>Unavailable</html>'),
+            dict(code=HTTPStatus.OK, body=payload),
+        ])
+
+        data = await client.get_data('dummy_url')
+
+        assert data == payload
+        sleep.assert_called_once_with(1.5)
+
+
+@pytest.mark.asyncio
+async def test_get_data_error_without_body(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.NOT_FOUND, text='')])
+
+        assert await client.get_data('dummy_url') is None
+
+
+@pytest.mark.asyncio
+async def test_get_data_server_error_backs_off(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.random.uniform', return_value=0.5):
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.SERVICE_UNAVAILABLE, body={}),
+            dict(code=HTTPStatus.SERVICE_UNAVAILABLE, body={}),
+            dict(code=HTTPStatus.OK, body={}),
+        ])
+
+        await client.get_data('dummy_url')
+
+        assert len(session.call_args_list) == 3
+        assert sleep.call_args_list == [mock.call(1.5), mock.call(2.5)]
+
+
+@pytest.mark.asyncio
+async def test_get_data_gives_up_after_max_attempts(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep:
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.SERVICE_UNAVAILABLE, body={}),
+        ] * TMDbClient.MAX_ATTEMPTS)
+
+        data = await client.get_data('dummy_url')
+
+        assert data is None
+        assert len(session.call_args_list) == TMDbClient.MAX_ATTEMPTS
+        assert sleep.call_count == TMDbClient.MAX_ATTEMPTS - 1
 
 
 @pytest.mark.asyncio
@@ -82,13 +261,13 @@ async def test_get_data_other_error(client):
 
         assert data is None
         assert len(session.call_args_list) == 1
-        session.assert_called_with('dummy_url', headers=client.headers)
+        assert session.assert_called_with('dummy_url', headers=client.headers)
 
 
 @pytest.mark.asyncio
 async def test_get_movie(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
-        _get_data.return_value = future_from(dict(id=1, original_title='Test Movie'))
+        _get_data.return_value = dict(id=1, original_title='Test Movie')
 
         movie = await client.get_movie(123)
 
@@ -99,12 +278,30 @@ async def test_get_movie(client, token):
         )
 
 
+@pytest.mark.asyncio
+async def test_get_movies(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.side_effect = [
+            dict(id=1, original_title='Test Movie'),
+            dict(id=2, original_title='Test Movie'),
+        ]
+
+        movies = await client.get_movies([123, 456])
+
+        assert [movie.title for movie in movies] == ['Test Movie'] * 2
+        _get_data.assert_has_calls([
+            mock.call('https://api.themoviedb.org/3/movie/{}'
+                      '?append_to_response=credits&api_key={}'.format(id_, token))
+            for id_ in (123, 456)
+        ], any_order=True)
+
+
 @pytest.mark.asyncio
 async def test_find_movie(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
-        _get_data.return_value = future_from({
+        _get_data.return_value = {
             'results': [{'id': 1, 'original_title': 'Test Movie'}],
-        })
+        }
 
         result = await client.find_movie('test movie')
 
@@ -115,10 +312,42 @@ async def test_find_movie(client, token):
         )
 
 
+@pytest.mark.asyncio
+async def test_find_movie_encodes_query_once(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.return_value = {'results': []}
+
+        await client.find_movie('amélie & 100%')
+
+        _get_data.assert_called_once_with(
+            'https://api.themoviedb.org/3/search/movie'
+            '?query=am%C3%A9lie+%26+100%25&include_adult=False'
+            '&api_key={}'.format(token),
+        )
+
+
+@pytest.mark.asyncio
+async def test_find_movies(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.side_effect = [
+            {'results': [{'id': 1, 'original_title': 'Test Movie'}]},
+            {'results': []},
+        ]
+
+        results = await client.find_movies(['test', 'movie'])
+
+        assert len(results) == 2
+        _get_data.assert_has_calls([
+            mock.call('https://api.themoviedb.org/3/search/movie'
+                      '?query={}&include_adult=False&api_key={}'.format(query, token))
+            for query in ('test', 'movie')
+        ], any_order=True)
+
+
 @pytest.mark.asyncio
 async def test_get_person(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
-        _get_data.return_value = future_from(dict(id=1, name='Some Name'))
+        _get_data.return_value = dict(id=1, name='Some Name')
 
         person = await client.get_person(123)
 
@@ -129,12 +358,30 @@ async def test_get_person(client, token):
         )
 
 
+@pytest.mark.asyncio
+async def test_get_people(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.side_effect = [
+            dict(id=1, name='Some Name'),
+            dict(id=2, name='Some Name'),
+        ]
+
+        people = await client.get_people([123, 456])
+
+        assert [person.name for person in people] == ['Some Name'] * 2
+        _get_data.assert_has_calls([
+            mock.call('https://api.themoviedb.org/3/person/{}'
+                      '?append_to_response=movie_credits&api_key={}'.format(id_, token))
+            for id_ in (123, 456)
+        ], any_order=True)
+
+
 @pytest.mark.asyncio
 async def test_find_person(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
-        _get_data.return_value = future_from({
+        _get_data.return_value = {
             'results': [{'id': 1, 'name': 'Some Person'}],
-        })
+        }
 
         result = await client.find_person('some person')
 
@@ -145,17 +392,35 @@ async def test_find_person(client, token):
         )
 
 
+@pytest.mark.asyncio
+async def test_find_people(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.side_effect = [
+            {'results': [{'id': 1, 'name': 'Some Person'}]},
+            {'results': []},
+        ]
+
+        results = await client.find_people(['some', 'person'])
+
+        assert len(results) == 2
+        _get_data.assert_has_calls([
+            mock.call('https://api.themoviedb.org/3/search/person'
+                      '?query={}&include_adult=False&api_key={}'.format(query, token))
+            for query in ('some', 'person')
+        ], any_order=True)
+
+
 @pytest.mark.asyncio
 async def test_get_random_actor_simple(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
         _get_data.side_effect = [
-            future_from({
+            {
                 'page': 1,
                 'results': [{'id': 1, 'name': 'Some Person'}],
                 'total_results': 1,
                 'total_pages': 1,
-            }),
-            future_from({'biography': 'extra stuff'}),
+            },
+            {'biography': 'extra stuff'},
         ]
 
         result = await client.get_random_popular_person(1)
@@ -174,19 +439,19 @@ async def test_get_random_actor_simple(client, token):
 async def test_get_random_actor_paged(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data, \
             mock.patch('atmdb.client.random.randrange', return_value=15) as randrange:
-        first_page = future_from({
+        first_page = {
             'page': 1,
             'results': [{}] * 10,
             'total_results': 20,
             'total_pages': 2,
-        })
-        second_page = future_from({
+        }
+        second_page = {
             'page': 2,
-            'results': ([{}] * 4) + [{'id': 1, 'name': 'Some Person'}, {}],
+            'results': ([{}] * 5) + [{'id': 1, 'name': 'Some Person'}] + ([{}] * 4),
             'total_results': 20,
             'total_pages': 2,
-        })
-        person = future_from({'biography': 'extra stuff'})
+        }
+        person = {'biography': 'extra stuff'}
         _get_data.side_effect = [first_page, second_page, person]
 
         result = await client.get_random_popular_person(1)
@@ -201,3 +466,527 @@ async def test_get_random_actor_paged(client, token):
             mock.call('https://api.themoviedb.org/3/person/1'
                       '?api_key={}'.format(token)),
         ])
+
+
+@pytest.mark.asyncio
+async def test_get_random_actor_paged_concurrently(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data, \
+            mock.patch('atmdb.client.random.randrange', return_value=25):
+        pages = {
+            1: {
+                'page': 1,
+                'results': [{}] * 20,
+                'total_results': 40,
+                'total_pages': 2,
+            },
+            2: {
+                'page': 2,
+                'results': ([{}] * 5) + [{'id': 1, 'name': 'Some Person'}] + ([{}] * 14),
+                'total_results': 40,
+                'total_pages': 2,
+            },
+        }
+        person_url = 'https://api.themoviedb.org/3/person/1?api_key={}'.format(token)
+
+        def get_data(url):
+            if url == person_url:
+                return {'biography': 'extra stuff'}
+            return pages[int(url.split('page=')[1].split('&')[0])]
+
+        _get_data.side_effect = get_data
+
+        result = await client.get_random_popular_person()
+
+        assert result.name == 'Some Person'
+        assert len(_get_data.call_args_list) == 3
+        for page in (1, 2):
+            assert mock.call(
+                'https://api.themoviedb.org/3/person/popular'
+                '?page={}&api_key={}'.format(page, token)
+            ) in _get_data.call_args_list
+
+
+@pytest.mark.asyncio
+async def test_get_random_actor_reuses_popular_pages(client, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        _get_data.side_effect = [
+            {
+                'page': 1,
+                'results': [{'id': 1, 'name': 'Some Person'}],
+                'total_results': 1,
+                'total_pages': 1,
+            },
+            {'biography': 'extra stuff'},
+            {'biography': 'extra stuff'},
+        ]
+
+        await client.get_random_popular_person(1)
+        result = await client.get_random_popular_person(1)
+
+        assert result.name == 'Some Person'
+        popular_url = ('https://api.themoviedb.org/3/person/popular'
+                       '?page=1&api_key={}'.format(token))
+        assert _get_data.call_args_list.count(mock.call(popular_url)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_random_actor_leaves_shared_data_unchanged(client):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        page = {
+            'page': 1,
+            'results': [{
+                'id': 1,
+                'name': 'Some Person',
+                'known_for': [{
+                    'id': 2,
+                    'media_type': 'movie',
+                    'original_title': 'Some Movie',
+                    'release_date': '2012-04-25',
+                }],
+            }],
+            'total_results': 1,
+            'total_pages': 1,
+        }
+        details = {'biography': 'extra stuff'}
+        expected = deepcopy((page, details))
+        _get_data.side_effect = [page, details, details]
+
+        await client.get_random_popular_person(1)
+        result = await client.get_random_popular_person(1)
+
+        assert {movie.release_year for movie in result.known_for} == {2012}
+        assert (page, details) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_random_actor_popular_pages_expire(client):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        page = {
+            'page': 1,
+            'results': [{'id': 1, 'name': 'Some Person'}],
+            'total_results': 1,
+            'total_pages': 1,
+        }
+        _get_data.return_value = page
+        client._popular_pages[1] = (time.monotonic() - 1, {})
+
+        assert await client._get_popular_people_page() == page
+        _get_data.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_data_reuses_session(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body={}),
+            dict(code=HTTPStatus.OK, body={}),
+        ])
+
+        await client.get_data('dummy_url')
+        first_session = client._session
+        await client.get_data('dummy_url')
+
+        assert client._session is first_session
+        await client.close()
+        assert first_session.closed
+        assert client._session is None
+
+
+@pytest.mark.asyncio
+async def test_get_data_cached(client):
+    client.cache = SimpleCache()
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body=payload, headers={'Cache-Control': 'max-age=600'}),
+        ])
+
+        first = await client.get_data('dummy_url')
+        second = await client.get_data('dummy_url')
+
+        assert first == second == payload
+        assert len(session.call_args_list) == 1
+        assert client.cache.expiry['dummy_url'] == 600
+
+
+@pytest.mark.parametrize('headers,expected', [
+    ({}, None),
+    ({'Cache-Control': 'public, max-age=600'}, 600),
+    ({'Cache-Control': 'no-store'}, 0),
+    ({'Cache-Control': 'max-age=600', 'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'}, 600),
+    ({'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'}, 0),
+    ({'Expires': '0'}, 0),
+])
+def test_calculate_cache_lifetime(headers, expected):
+    assert TMDbClient.calculate_cache_lifetime(headers) == expected
+
+
+def test_calculate_cache_lifetime_expires():
+    three_minutes_later = datetime.now(tz=timezone.utc) + timedelta(minutes=3)
+    expires = three_minutes_later.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    assert 179 <= TMDbClient.calculate_cache_lifetime({'Expires': expires}) <= 181
+
+
+@pytest.mark.asyncio
+async def test_get_data_not_cached_no_store(client):
+    client.cache = SimpleCache()
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body={}, headers={'Cache-Control': 'no-store'}),
+        ])
+
+        await client.get_data('dummy_url')
+
+        assert 'dummy_url' not in client.cache
+
+
+@pytest.mark.asyncio
+async def test_get_data_cached_default_expiry(client):
+    client.cache = SimpleCache()
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body={})])
+
+        await client.get_data('dummy_url')
+
+        assert client.cache.expiry['dummy_url'] == TMDbClient.CACHE_EXPIRY
+
+
+@pytest.mark.asyncio
+async def test_get_data_waits_for_rate_limit_reset(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.time.time', return_value=1000):
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body={}, headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': '1010',
+            }),
+            dict(code=HTTPStatus.OK, body={}),
+        ])
+
+        await client.get_data('dummy_url')
+        sleep.assert_not_called()
+        await client.get_data('dummy_url')
+
+        sleep.assert_called_once_with(10)
+
+
+@pytest.mark.asyncio
+async def test_get_data_ignores_invalid_rate_limit_reset(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.asyncio.sleep') as sleep:
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body=payload, headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': 'soon',
+            }),
+            dict(code=HTTPStatus.OK, body={}),
+        ])
+
+        data = await client.get_data('dummy_url')
+        await client.get_data('dummy_url')
+
+        assert data == payload
+        sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_delays_requests(token):
+    client = TMDbClient(api_token=token, rate_limit=(2, 10))
+    with mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.time') as clock:
+        clock.monotonic.side_effect = [0, 1, 2, 10]
+
+        await client._wait_for_rate_limit()
+        await client._wait_for_rate_limit()
+        sleep.assert_not_called()
+        await client._wait_for_rate_limit()
+
+        sleep.assert_called_once_with(8)
+        assert list(client._request_times) == [1, 10]
+
+
+@pytest.mark.parametrize('rate_limit', [(0, 10), (1, 0)])
+def test_rate_limit_invalid(token, rate_limit):
+    with pytest.raises(ValueError):
+        TMDbClient(api_token=token, rate_limit=rate_limit)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_reset_on_close(token):
+    client = TMDbClient(api_token=token, rate_limit=(2, 10))
+    with mock.patch('atmdb.client.asyncio.sleep'):
+        await client._wait_for_rate_limit()
+
+    await client.close()
+
+    assert client._request_lock is None
+    assert client._request_times is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_set_after_creation(client):
+    client.rate_limit = (1, 10)
+    with mock.patch('atmdb.client.asyncio.sleep') as sleep, \
+            mock.patch('atmdb.client.time') as clock:
+        clock.monotonic.side_effect = [0, 1, 10]
+
+        await client._wait_for_rate_limit()
+        await client._wait_for_rate_limit()
+
+        sleep.assert_called_once_with(9)
+
+
+@pytest.mark.asyncio
+async def test_get_data_shares_in_flight_requests(client):
+    payload = {'some': 'data'}
+
+    async def fetch_data(url, use_cache):
+        await asyncio.sleep(0)
+        return payload
+
+    with mock.patch.object(TMDbClient, '_fetch_data', side_effect=fetch_data) as _fetch_data:
+        first, second = await asyncio.gather(
+            client.get_data('dummy_url'),
+            client.get_data('dummy_url'),
+        )
+
+        assert first == second == payload
+        _fetch_data.assert_called_once_with('dummy_url', False)
+        assert not client._pending
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_in_flight_requests(client):
+    async def fetch_data(url, use_cache):
+        await asyncio.Event().wait()
+
+    with mock.patch.object(TMDbClient, '_fetch_data', side_effect=fetch_data):
+        caller = asyncio.ensure_future(client.get_data('dummy_url'))
+        await asyncio.sleep(0)
+        pending = client._pending['dummy_url']
+
+        await client.close()
+
+        assert not client._pending
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert pending.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_get_data_uses_configured_loader(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session, \
+            mock.patch('atmdb.client.json_loads', return_value={'some': 'data'}) as loads:
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body={})])
+
+        data = await client.get_data('dummy_url')
+
+        assert data == {'some': 'data'}
+        loads.assert_called_once_with('{}')
+
+
+@pytest.mark.asyncio
+async def test_get_data_revalidates_etag(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body=payload, headers={'ETag': '"abc"'}),
+            dict(code=HTTPStatus.NOT_MODIFIED),
+        ])
+
+        first = await client.get_data('dummy_url')
+        second = await client.get_data('dummy_url')
+
+        assert first == second == payload
+        assert session.request_headers == [None, {'If-None-Match': '"abc"'}]
+
+
+@pytest.mark.asyncio
+async def test_get_person_revalidated(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {
+            'id': 1,
+            'name': 'Some Person',
+            'birthday': '1963-12-18',
+            'movie_credits': {'cast': [{'id': 2, 'original_title': 'Some Movie'}]},
+        }
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body=payload, headers={'ETag': '"abc"'}),
+            dict(code=HTTPStatus.NOT_MODIFIED),
+        ])
+
+        first = await client.get_person(1)
+        second = await client.get_person(1)
+
+        assert first is second
+        assert second.birthday == date(1963, 12, 18)
+        assert {movie.title for movie in second.movie_credits} == {'Some Movie'}
+
+
+@pytest.mark.asyncio
+async def test_get_movie_revalidated(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {
+            'id': 1,
+            'original_title': 'Some Movie',
+            'release_date': '2012-04-25',
+            'credits': {'cast': [{
+                'id': 2,
+                'name': 'Some Person',
+                'movie_credits': {'cast': []},
+            }]},
+        }
+        session.configure_mock(side_effect=[
+            dict(code=HTTPStatus.OK, body=payload, headers={'ETag': '"abc"'}),
+            dict(code=HTTPStatus.NOT_MODIFIED),
+        ])
+
+        await client.get_movie(1)
+        movie = await client.get_movie(1)
+
+        assert movie.release_year == 2012
+        assert {person.name for person in movie.cast} == {'Some Person'}
+
+
+@pytest.mark.asyncio
+async def test_get_data_memory_cache(client):
+    client.cache = MemoryCache()
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body=payload)])
+
+        first = await client.get_data('dummy_url')
+        second = await client.get_data('dummy_url')
+
+        assert first == second == payload
+        assert len(session.call_args_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_movie_memory_cache(client):
+    client.cache = MemoryCache()
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SimpleSessionMock) as session:
+        payload = {
+            'id': 1,
+            'original_title': 'Some Movie',
+            'release_date': '2012-04-25',
+            'credits': {'cast': [{'id': 2, 'name': 'Some Person'}]},
+        }
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body=payload)])
+
+        await client.get_movie(1)
+        movie = await client.get_movie(1)
+
+        assert movie.release_year == 2012
+        assert {person.name for person in movie.cast} == {'Some Person'}
+        assert len(session.call_args_list) == 1
+
+
+def test_memory_cache_expiry():
+    cache = MemoryCache()
+    with mock.patch('atmdb.core.time.monotonic', return_value=1000):
+        cache.set('key', 'value', expire=10)
+        assert cache.get('key') == 'value'
+    with mock.patch('atmdb.core.time.monotonic', return_value=1010):
+        assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set('first', 1)
+    cache.set('second', 2)
+    cache.get('first')
+    cache.set('third', 3)
+    assert cache.get('second') is None
+    assert cache.get('first') == 1
+    assert cache.get('third') == 3
+
+
+class SlowSessionMock(SimpleSessionMock):
+
+    active = peak = 0
+
+    async def __aenter__(self):
+        SlowSessionMock.active += 1
+        SlowSessionMock.peak = max(SlowSessionMock.peak, SlowSessionMock.active)
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *_):
+        SlowSessionMock.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_get_person_concurrently(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SlowSessionMock) as session:
+        payload = {
+            'id': 1,
+            'name': 'Some Person',
+            'birthday': '1963-12-18',
+            'movie_credits': {'cast': [{'id': 2, 'original_title': 'Some Movie'}]},
+        }
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body=payload)])
+
+        first, second = await asyncio.gather(
+            client.get_person(1),
+            client.get_person(1),
+        )
+
+        assert first is second
+        assert second.birthday == date(1963, 12, 18)
+        assert len(session.call_args_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_data_survives_cancelled_caller(client):
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SlowSessionMock) as session:
+        payload = {'some': 'data'}
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body=payload)])
+
+        owner = asyncio.ensure_future(client.get_data('dummy_url'))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(client.get_data('dummy_url'))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == payload
+        assert owner.cancelled()
+        assert len(session.call_args_list) == 1
+        assert not client._pending
+
+
+@pytest.mark.asyncio
+async def test_get_data_concurrency_limit(token, config):
+    client = TMDbClient(api_token=token, max_concurrency=2)
+    client.config = config
+    client._config_expiry = time.monotonic() + TMDbClient.CONFIG_LIFETIME
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SlowSessionMock) as session:
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body={})] * 10)
+
+        await asyncio.gather(*(
+            client.get_data('dummy_url_{}'.format(index)) for index in range(10)
+        ))
+
+        assert len(session.call_args_list) == 10
+        assert session.peak == 2
+
+
+def test_client_reused_after_close(client):
+    client.max_concurrency = 1
+
+    async def use_client():
+        await asyncio.gather(*(
+            client.get_data('dummy_url_{}'.format(index)) for index in range(3)
+        ))
+        await client.close()
+
+    with mock.patch('atmdb.client.aiohttp.ClientSession', SlowSessionMock) as session:
+        session.configure_mock(side_effect=[dict(code=HTTPStatus.OK, body={})] * 6)
+
+        asyncio.run(use_client())
+        asyncio.run(use_client())
+
+        assert len(session.call_args_list) == 6
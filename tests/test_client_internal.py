@@ -1,24 +1,24 @@
 from datetime import datetime, timedelta
+import time
+from unittest import mock
 
-from asynctest import mock
 import pytest
 
 from atmdb import TMDbClient
 
-from tests.helpers import future_from
-
 
 @pytest.mark.asyncio
 async def test_update_config_missing(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
         client.config = dict(data=None, last_update=None)
         data = {'some': 'data'}
-        _get_data.return_value = future_from(data)
+        _get_data.return_value = data
 
         await client._update_config()
 
         assert client.config.get('data') == data
         assert isinstance(client.config.get('last_update'), datetime)
+        assert not client.config_expired
         _get_data.assert_called_once_with(
             'https://api.themoviedb.org/3/configuration?api_key={}'.format(token)
         )
@@ -28,9 +28,12 @@ async def test_update_config_missing(client, token):
 async def test_update_config_outdated(client, token):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
         data = {'some': 'data'}
-        _get_data.return_value = future_from(data)
+        _get_data.return_value = data
         last_week = datetime.now() - timedelta(days=7)
         client.config = dict(data={}, last_update=last_week)
+        client._config_expiry = (
+            time.monotonic() - TMDbClient.CONFIG_STALE_LIFETIME - 1
+        )
 
         await client._update_config()
 
@@ -42,6 +45,43 @@ async def test_update_config_outdated(client, token):
         )
 
 
+@pytest.mark.asyncio
+async def test_update_config_stale(client, config, token):
+    with mock.patch.object(TMDbClient, 'get_data') as _get_data:
+        data = {'some': 'data'}
+        _get_data.return_value = data
+        client._config_expiry = time.monotonic() - 1
+
+        await client._update_config()
+
+        assert client.config == config
+        refresh = client._config_refresh
+        assert refresh is not None
+
+        await client._update_config()
+
+        assert client._config_refresh is refresh
+        await refresh
+        assert client.config.get('data') == data
+        assert not client.config_expired
+        assert client._config_refresh is None
+        _get_data.assert_called_once_with(
+            'https://api.themoviedb.org/3/configuration?api_key={}'.format(token)
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_config_stale_failure(client, config):
+    with mock.patch.object(TMDbClient, 'get_data', return_value=None):
+        client._config_expiry = time.monotonic() - 1
+
+        await client._update_config()
+        await client._config_refresh
+
+        assert client.config == config
+        assert client.config_expired
+
+
 @pytest.mark.asyncio
 async def test_update_config_up_to_date(client, config):
     with mock.patch.object(TMDbClient, 'get_data') as _get_data:
@@ -63,4 +103,23 @@ def test_calculate_page(client):
         total_pages=3,
         total_results=50,
     )
-    assert client._calculate_page_index(25, data) == (2, 4)
+    assert client._calculate_page_index(25, data) == (2, 5)
+
+
+def test_calculate_page_start(client):
+    data = dict(
+        page=1,
+        results=[{}] * 20,
+        total_pages=3,
+        total_results=50,
+    )
+    assert client._calculate_page_index(20, data) == (2, 0)
+
+
+def test_search_url(client, token):
+    url = client._search_url('search/movie', 'test movie')
+
+    assert url == ('https://api.themoviedb.org/3/search/movie'
+                   '?query=test+movie&include_adult=False&api_key={}'.format(token))
+    assert client._search_url('search/movie', 'test movie') is url
+    assert client._search_url.cache_info().hits == 1
@@ -1,6 +1,9 @@
+from copy import deepcopy
 from datetime import date
 from textwrap import dedent
 
+import pytest
+
 from atmdb.models import Movie, Person
 
 
@@ -29,6 +32,62 @@ def test_movie_model_from_json():
     assert movie.release_year == 2012
 
 
+def test_models_from_json_leave_json_unchanged():
+    movie_json = dict(
+        id=1,
+        original_title='Some Title',
+        credits=dict(cast=[{'name': 'Some Person', 'id': 1, 'birthday': '1970-01-01'}]),
+        release_date='2012-05-08',
+    )
+    person_json = dict(
+        id=1,
+        name='Some Person',
+        known_for=[{'id': 2, 'media_type': 'movie', 'release_date': '2012-05-08'}],
+        movie_credits=dict(cast=[{'id': 2, 'release_date': '2012-05-08'}]),
+    )
+    expected = deepcopy((movie_json, person_json))
+
+    Movie.from_json(movie_json)
+    Person.from_json(person_json)
+
+    assert (movie_json, person_json) == expected
+
+
+def test_movie_model_from_json_reuses_instance():
+    movie = Movie.from_json(dict(id=1, original_title='Some Title'))
+    same = Movie.from_json(dict(id=1, overview='Some synopsis.'))
+    assert same is movie
+    assert movie.title == 'Some Title'
+    assert movie.synopsis == 'Some synopsis.'
+    assert Person.from_json(dict(id=1, name='Some Person')) is not movie
+
+
+def test_movie_model_from_json_without_id():
+    first = Movie.from_json(dict(original_title='Some Title'))
+    second = Movie.from_json(dict(original_title='Another Title'))
+    assert first is not second
+    assert first.title == 'Some Title'
+    assert second.title == 'Another Title'
+
+
+def test_movie_model_from_json_lazy_cast():
+    movie = Movie.from_json(dict(
+        id=1,
+        original_title='Some Title',
+        credits=dict(cast=[{'name': 'Some Person', 'id': 1}]),
+    ), eager=False)
+    assert movie.cast == {Person(id_=1, name='Some Person')}
+
+
+def test_person_model_from_json_batch():
+    people = Person.from_json_batch([
+        {'id': 1, 'name': 'Some Person', 'birthday': '1970-01-01'},
+        {'id': 2, 'name': 'Another Person'},
+    ])
+    assert people == {Person(id_=1, name=''), Person(id_=2, name='')}
+    assert Person.from_json_batch([]) is None
+
+
 def test_person_model():
     name = 'Some Person'
     credits_ = [{'some': 'thing', 'id': 1}]
@@ -111,3 +170,14 @@ def test_person_model_handles_deceased_actors():
     })
     assert not person.alive
     assert person.age == 50
+
+
+@pytest.mark.parametrize('date_str,expected', [
+    (None, None),
+    ('', None),
+    ('1978-03-17', date(1978, 3, 17)),
+    ('1978-13-17', None),
+    ('unknown', None),
+])
+def test_person_extract_date(date_str, expected):
+    assert Person.extract_date(date_str) == expected
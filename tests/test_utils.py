@@ -1,8 +1,13 @@
+from unittest import mock
+
 import pytest
-from asynctest import mock
 
 from atmdb.models import Movie, Person
-from atmdb.utils import overlapping_actors, overlapping_movies
+from atmdb.utils import (
+    find_overlapping_movies,
+    overlapping_actors,
+    overlapping_movies,
+)
 
 
 @pytest.mark.asyncio
@@ -105,3 +110,82 @@ async def test_overlapping_actors(client):
         assert len(people) == 1
         assert Person(id_=2, name='') in people
         get_person.assert_called_once_with(id_=2)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_actors_omits_failed_requests(client):
+    with mock.patch.object(client, 'get_person') as get_person:
+        movie1 = Movie(
+            id_=1,
+            cast={Person(id_=1, name=''), Person(id_=2, name='')},
+            title='',
+        )
+        movie2 = Movie(
+            id_=2,
+            cast={Person(id_=1, name=''), Person(id_=2, name='')},
+            title='',
+        )
+        get_person.side_effect = lambda id_: None if id_ == 1 else Person(id_=id_, name='')
+
+        people = await overlapping_actors([movie1, movie2], client)
+
+        assert people == [Person(id_=2, name='')]
+        assert get_person.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_overlapping_movies(client):
+    with mock.patch.object(client, 'find_person') as find_person, \
+            mock.patch.object(client, 'get_person') as get_person, \
+            mock.patch.object(client, 'get_movie') as get_movie:
+        find_person.side_effect = [
+            [Person(id_=1, name='')],
+            [Person(id_=2, name='')],
+        ]
+        get_person.side_effect = [
+            Person(
+                id_=1,
+                movie_credits={Movie(id_=1, title=''), Movie(id_=2, title='')},
+                name='',
+            ),
+            Person(
+                id_=2,
+                movie_credits={Movie(id_=2, title=''), Movie(id_=3, title='')},
+                name='',
+            ),
+        ]
+        get_movie.return_value = Movie(id_=2, title='')
+
+        movies = await find_overlapping_movies(['first', 'second'], client)
+
+        assert movies == [Movie(id_=2, title='')]
+        get_person.assert_has_calls([mock.call(id_=1), mock.call(id_=2)])
+        get_movie.assert_called_once_with(id_=2)
+
+
+@pytest.mark.asyncio
+async def test_find_overlapping_movies_no_result(client):
+    with mock.patch.object(client, 'find_person') as find_person:
+        find_person.side_effect = [[Person(id_=1, name='')], []]
+
+        with pytest.raises(ValueError):
+            await find_overlapping_movies(['first', 'second'], client)
+
+
+@pytest.mark.asyncio
+async def test_find_overlapping_movies_duplicate_candidates(client):
+    with mock.patch.object(client, 'find_person') as find_person, \
+            mock.patch.object(client, 'get_person') as get_person, \
+            mock.patch.object(client, 'get_movie') as get_movie:
+        find_person.return_value = [Person(id_=1, name='')]
+        get_person.return_value = Person(
+            id_=1,
+            movie_credits={Movie(id_=1, title='')},
+            name='',
+        )
+        get_movie.return_value = Movie(id_=1, title='')
+
+        movies = await find_overlapping_movies(['first', 'again'], client)
+
+        assert movies == [Movie(id_=1, title='')]
+        get_person.assert_called_once_with(id_=1)